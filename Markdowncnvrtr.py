@@ -1,6 +1,9 @@
-from typing import List, Type, Dict, Any, Tuple
-from pydantic import BaseModel, create_model
-import html2text
+from typing import List, Type, Dict, Any, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+# pydantic and html2text are imported inside the functions that need them to keep imports cheap.
 # Constants
 USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
@@ -58,16 +61,19 @@ USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.77 Safari/537.36",
     "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.77 Safari/537.36"
 ]
-def create_dynamic_listing_model(field_names: List[str]) -> Type[BaseModel]:
+def create_dynamic_listing_model(field_names: List[str]) -> Type["BaseModel"]:
     """Creates a dynamic Pydantic model based on field names."""
+    from pydantic import create_model
     field_definitions = {field.strip(): (str, ...) for field in field_names}
     return create_model('DynamicListingModel', **field_definitions)
 
-def create_listings_container_model(listing_model: Type[BaseModel]) -> Type[BaseModel]:
+def create_listings_container_model(listing_model: Type["BaseModel"]) -> Type["BaseModel"]:
    """Creates a container model for listings."""
+   from pydantic import create_model
    return create_model('DynamicListingsContainer', listings=(List[listing_model], ...))
 def html_to_markdown_with_readability(raw_html: str) -> str:
     """Converts HTML to markdown format with improved readability."""
+    import html2text
     try:
         markdown_converter = html2text.HTML2Text()
         markdown_converter.ignore_links = False
@@ -0,0 +1,278 @@
+import re
+import zlib
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Tuple
+
+# MinHash / LSH parameters: 16 bands of 4 rows catch pairs with a Jaccard
+# similarity of roughly 0.5 and above as candidates.
+NUM_PERMUTATIONS = 64
+LSH_BANDS = 16
+SHINGLE_SIZE = 4
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_PERMUTATIONS = [
+    (1 + (i * 0x9E3779B1) % (_MERSENNE_PRIME - 1), (i * 0x85EBCA77 + 0xC2B2AE3D) % _MERSENNE_PRIME)
+    for i in range(1, NUM_PERMUTATIONS + 1)
+]
+# A ("field", name, value) candidate bucket larger than this marks a low-cardinality
+# value (e.g. currency, availability); it is dropped and never indexed again.
+MAX_FIELD_BUCKET = 50
+_PUNCTUATION = re.compile(r"[^\w\s]")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@dataclass
+class ReconcileStats:
+    """Per-run counters reported by the reconciliation stage."""
+    records_in: int = 0
+    records_out: int = 0
+    empty_dropped: int = 0
+    exact_duplicates: int = 0
+    near_duplicates: int = 0
+    partial_merges: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+def normalize_field_name(name: Any) -> str:
+    """Normalizes a field name so 'Title ' from the model matches a requested 'title'."""
+    return str(name).strip().lower()
+
+
+def normalize_value(value: Any) -> str:
+    """Normalizes a field value for comparison (case, punctuation, whitespace)."""
+    if value is None:
+        return ""
+    text = _PUNCTUATION.sub(" ", str(value).lower())
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def record_key(normalized: Dict[str, str], identity_fields: List[str]) -> Optional[str]:
+    """Hashes the identity fields of a normalized record; None if any of them is empty."""
+    values = [normalized.get(field, "") for field in identity_fields]
+    if not all(values):
+        return None
+    return hashlib.sha1("\x1f".join(values).encode("utf-8")).hexdigest()
+
+
+def minhash_signature(normalized: Dict[str, str]) -> Tuple[Tuple[int, ...], int]:
+    """Returns the MinHash signature and shingle count of a normalized record."""
+    text = " ".join(value for _, value in sorted(normalized.items()) if value)
+    if len(text) <= SHINGLE_SIZE:
+        shingles = {text}
+    else:
+        shingles = {text[i:i + SHINGLE_SIZE] for i in range(len(text) - SHINGLE_SIZE + 1)}
+    hashes = [zlib.crc32(shingle.encode("utf-8")) for shingle in shingles]
+    signature = tuple(
+        min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+        for a, b in _PERMUTATIONS
+    )
+    return signature, len(shingles)
+
+
+def _estimate_jaccard(left: Tuple[int, ...], right: Tuple[int, ...]) -> float:
+    return sum(1 for x, y in zip(left, right) if x == y) / NUM_PERMUTATIONS
+
+
+class _Entry:
+    __slots__ = ("record", "normalized", "key", "signature", "index_keys")
+
+    def __init__(self, record, normalized):
+        self.record = record
+        self.normalized = normalized
+        self.key = None
+        self.signature = ()
+        self.index_keys = []
+
+
+class RecordReconciler:
+    """
+    Streams extracted records, folding duplicates and partial rows into a single record.
+
+    Records are matched in three ways:
+        - exact: same normalized values on all identity fields (hashed key),
+        - partial: one record is missing values the other has, every field both have agrees,
+          and they share all but at most one identity value (e.g. a listing split across chunks),
+        - near-duplicate: estimated MinHash Jaccard similarity >= near_duplicate_threshold.
+    Field names are compared case-insensitively. Fuzzy matching only applies when one of
+    the two records is missing an identity value and both share at least one; records whose
+    identity values differ are never merged.
+    Matched records are merged by filling empty fields of the kept record.
+
+    Only the most recent `window_size` records stay eligible for matching; older
+    ones are emitted and dropped from the indexes so memory stays bounded.
+    """
+
+    def __init__(self, identity_fields: Optional[List[str]] = None,
+                 near_duplicate_threshold: float = 0.9, window_size: int = 5000):
+        self.identity_fields = (
+            list(dict.fromkeys(normalize_field_name(field) for field in identity_fields)) if identity_fields else None
+        )
+        self.near_duplicate_threshold = near_duplicate_threshold
+        self.window_size = window_size
+        self.stats = ReconcileStats()
+        self._window: "OrderedDict[int, _Entry]" = OrderedDict()
+        self._exact_index: Dict[str, int] = {}
+        self._candidate_index: Dict[Tuple, set] = {}
+        self._saturated: set = set()
+        self._next_id = 0
+
+    def add(self, record: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Adds a record and returns any records evicted from the matching window."""
+        self.stats.records_in += 1
+        if not isinstance(record, dict):
+            self.stats.empty_dropped += 1
+            return []
+
+        normalized: Dict[str, str] = {}
+        for field, value in record.items():
+            name = normalize_field_name(field)
+            normalized[name] = normalized.get(name) or normalize_value(value)
+        if not any(normalized.values()):
+            self.stats.empty_dropped += 1
+            return []
+
+        entry = _Entry(dict(record), normalized)
+        self._compute_keys(entry)
+        if entry.key is not None and entry.key in self._exact_index:
+            self._merge_into(self._exact_index[entry.key], record, normalized)
+            self.stats.exact_duplicates += 1
+            return []
+
+        match = self._find_fuzzy_match(entry)
+        if match is not None:
+            entry_id, kind = match
+            self._merge_into(entry_id, record, normalized)
+            if kind == "near":
+                self.stats.near_duplicates += 1
+            else:
+                self.stats.partial_merges += 1
+            return []
+
+        entry_id = self._next_id
+        self._next_id += 1
+        self._window[entry_id] = entry
+        self._index(entry_id, entry)
+        return self._evict()
+
+    def flush(self) -> List[Dict[str, Any]]:
+        """Emits every record still held in the matching window."""
+        records = [entry.record for entry in self._window.values()]
+        self.stats.records_out += len(records)
+        self._window.clear()
+        self._exact_index.clear()
+        self._candidate_index.clear()
+        return records
+
+    def _identity(self, normalized: Dict[str, str]) -> List[str]:
+        return self.identity_fields or sorted(normalized)
+
+    def _compute_keys(self, entry: _Entry) -> None:
+        identity_fields = self._identity(entry.normalized)
+        entry.key = record_key(entry.normalized, identity_fields)
+        entry.signature, _ = minhash_signature(entry.normalized)
+        rows = NUM_PERMUTATIONS // LSH_BANDS
+        entry.index_keys = [("band", band, entry.signature[band * rows:(band + 1) * rows]) for band in range(LSH_BANDS)]
+        entry.index_keys.extend(
+            ("field", field, entry.normalized[field]) for field in identity_fields if entry.normalized.get(field)
+        )
+
+    def _find_fuzzy_match(self, entry: _Entry) -> Optional[Tuple[int, str]]:
+        candidate_ids = set()
+        for index_key in entry.index_keys:
+            candidate_ids.update(self._candidate_index.get(index_key, ()))
+
+        identity_fields = self._identity(entry.normalized)
+        if not any(entry.normalized.get(field) for field in identity_fields):
+            return None  # nothing to tell distinct records apart, so never merge fuzzily
+        # Prefer the most recent candidate: overlap comes from adjacent chunks and pages.
+        for entry_id in sorted(candidate_ids, reverse=True):
+            candidate = self._window[entry_id]
+            if entry.key is not None and candidate.key is not None:
+                continue  # both identities complete and different, or it would have been an exact hit
+            if self._identity_conflict(entry.normalized, candidate.normalized, identity_fields):
+                continue
+            if not self._shared_identity(entry.normalized, candidate.normalized, identity_fields):
+                continue
+            if self._is_partial_match(entry.normalized, candidate.normalized, identity_fields):
+                return entry_id, "partial"
+            if _estimate_jaccard(entry.signature, candidate.signature) >= self.near_duplicate_threshold:
+                return entry_id, "near"
+        return None
+
+    @staticmethod
+    def _identity_conflict(left: Dict[str, str], right: Dict[str, str], identity_fields: List[str]) -> bool:
+        return any(left.get(field) and right.get(field) and left[field] != right[field] for field in identity_fields)
+
+    @staticmethod
+    def _shared_identity(left: Dict[str, str], right: Dict[str, str], identity_fields: List[str]) -> List[str]:
+        return [field for field in identity_fields if left.get(field) and right.get(field)]
+
+    def _is_partial_match(self, left: Dict[str, str], right: Dict[str, str], identity_fields: List[str]) -> bool:
+        fields = set(left) | set(right)
+        shared = [field for field in fields if left.get(field) and right.get(field)]
+        if any(left[field] != right[field] for field in shared):
+            return False
+        # A split record misses at most one identity value; everything else must be there and agree.
+        if len(self._shared_identity(left, right, identity_fields)) < max(1, len(identity_fields) - 1):
+            return False
+        # At least one side must be missing a value the other has, otherwise it is an exact duplicate.
+        return any(bool(left.get(field)) != bool(right.get(field)) for field in fields)
+
+    def _merge_into(self, entry_id: int, record: Dict[str, Any], normalized: Dict[str, str]) -> None:
+        entry = self._window[entry_id]
+        # Fill gaps under the kept record's own spelling of each field name.
+        original_names = {normalize_field_name(field): field for field in entry.record}
+        changed = False
+        for field, value in record.items():
+            name = normalize_field_name(field)
+            if normalized.get(name) and not entry.normalized.get(name):
+                entry.record[original_names.get(name, field)] = value
+                entry.normalized[name] = normalized[name]
+                changed = True
+        if changed:
+            # Filled gaps can complete the identity key, so re-index the merged record.
+            self._unindex(entry_id, entry)
+            self._compute_keys(entry)
+            self._index(entry_id, entry)
+
+    def _index(self, entry_id: int, entry: _Entry) -> None:
+        if entry.key is not None:
+            self._exact_index.setdefault(entry.key, entry_id)
+        for index_key in entry.index_keys:
+            if index_key in self._saturated:
+                continue
+            bucket = self._candidate_index.setdefault(index_key, set())
+            bucket.add(entry_id)
+            if index_key[0] == "field" and len(bucket) > MAX_FIELD_BUCKET:
+                del self._candidate_index[index_key]
+                self._saturated.add(index_key)
+
+    def _unindex(self, entry_id: int, entry: _Entry) -> None:
+        if entry.key is not None and self._exact_index.get(entry.key) == entry_id:
+            del self._exact_index[entry.key]
+        for index_key in entry.index_keys:
+            bucket = self._candidate_index.get(index_key)
+            if bucket is not None:
+                bucket.discard(entry_id)
+                if not bucket:
+                    del self._candidate_index[index_key]
+
+    def _evict(self) -> List[Dict[str, Any]]:
+        evicted = []
+        while len(self._window) > self.window_size:
+            entry_id, entry = self._window.popitem(last=False)
+            self._unindex(entry_id, entry)
+            evicted.append(entry.record)
+        self.stats.records_out += len(evicted)
+        return evicted
+
+
+def reconcile_records(records: Iterable[Dict[str, Any]], reconciler: RecordReconciler) -> Iterator[Dict[str, Any]]:
+    """Streams records through a reconciler, yielding each record once it is final."""
+    for record in records:
+        yield from reconciler.add(record)
+    yield from reconciler.flush()
@@ -0,0 +1,100 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, TYPE_CHECKING
+from Markdowncnvrtr import create_dynamic_listing_model, create_listings_container_model
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel, TypeAdapter
+
+FieldKey = Tuple[str, ...]
+
+
+def normalize_fields(fields: Iterable[str]) -> FieldKey:
+    """Strips field names and drops blanks and repeats, keeping the first-seen order."""
+    seen = []
+    for field in fields:
+        name = str(field).strip()
+        if name and name not in seen:
+            seen.append(name)
+    return tuple(seen)
+
+
+class FieldSetEntry:
+    """Compiled artefacts for one field set; each is built on first access and then reused."""
+
+    def __init__(self, fields: FieldKey, prompt_builder: Optional[Callable[[FieldKey], str]] = None):
+        self.fields = fields
+        self._prompt_builder = prompt_builder
+
+    @cached_property
+    def listing_model(self) -> Type["BaseModel"]:
+        return create_dynamic_listing_model(list(self.fields))
+
+    @cached_property
+    def container_model(self) -> Type["BaseModel"]:
+        return create_listings_container_model(self.listing_model)
+
+    @cached_property
+    def validator(self) -> "TypeAdapter":
+        """Validates a list of listings, as returned by the model, in one call."""
+        from pydantic import TypeAdapter
+        return TypeAdapter(List[self.listing_model])
+
+    @cached_property
+    def json_schema(self) -> Dict[str, Any]:
+        return self.container_model.model_json_schema()
+
+    @cached_property
+    def prompt_prefix(self) -> str:
+        if self._prompt_builder is None:
+            raise ValueError("No prompt builder configured for this registry")
+        return self._prompt_builder(self.fields)
+
+
+@dataclass
+class RegistryStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+class FieldSetRegistry:
+    """
+    LRU cache of FieldSetEntry objects keyed by the normalized field tuple.
+
+    scraper.py takes the prompt prefix from here for every chunk. Models, validators and
+    JSON schemas are only built when a caller asks for them; create_dynamic_listing_model
+    and create_listings_container_model in Markdowncnvrtr remain uncached builders.
+    """
+
+    def __init__(self, prompt_builder: Optional[Callable[[FieldKey], str]] = None, maxsize: int = 128):
+        self.prompt_builder = prompt_builder
+        self.maxsize = maxsize
+        self.stats = RegistryStats()
+        self._entries: "OrderedDict[FieldKey, FieldSetEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, fields: Iterable[str]) -> FieldSetEntry:
+        key = normalize_fields(fields)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return entry
+            self.stats.misses += 1
+            entry = FieldSetEntry(key, self.prompt_builder)
+            self._entries[key] = entry
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+            return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
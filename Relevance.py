@@ -0,0 +1,231 @@
+import os
+import re
+import json
+from dataclasses import dataclass, asdict, field
+from typing import List, Dict, Optional, Sequence, Tuple
+from urllib.parse import urlparse
+
+# Synonyms checked alongside the literal field name when scoring a chunk.
+FIELD_SYNONYMS = {
+    "price": ["cost", "amount", "$", "£", "€", "usd", "eur", "gbp", "sale", "mrp"],
+    "title": ["name", "heading", "product"],
+    "name": ["title", "product"],
+    "rating": ["stars", "star", "score", "review", "reviews"],
+    "review": ["rating", "comment", "stars"],
+    "date": ["posted", "published", "updated", "time"],
+    "author": ["by", "writer", "posted by"],
+    "location": ["address", "city", "country", "remote"],
+    "address": ["location", "street", "city"],
+    "description": ["details", "summary", "about", "overview"],
+    "url": ["http", "www", "link"],
+    "link": ["http", "www", "url"],
+    "image": ["img", ".jpg", ".png", ".webp", "!["],
+    "company": ["employer", "organization", "inc", "ltd"],
+    "salary": ["pay", "wage", "compensation", "per year", "per hour"],
+    "availability": ["in stock", "out of stock", "available"],
+    "stock": ["in stock", "out of stock", "available"],
+}
+
+PRICE_PATTERN = re.compile(r"(?:[$£€₹¥]\s?\d[\d,]*(?:\.\d+)?)|(?:\d[\d,]*(?:\.\d+)?\s?(?:usd|eur|gbp|inr))", re.IGNORECASE)
+DATE_PATTERN = re.compile(
+    r"\b(?:\d{4}-\d{2}-\d{2}|\d{1,2}/\d{1,2}/\d{2,4}|"
+    r"(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.? \d{1,2},? \d{4})\b",
+    re.IGNORECASE,
+)
+
+KEYWORD_WEIGHT = 0.6
+DENSITY_WEIGHT = 0.4
+DEFAULT_THRESHOLD = 0.15
+MIN_DOMAIN_OBSERVATIONS = 5
+RELEVANCE_STATS_FILE = os.path.join("output", "relevance_stats.json")
+
+
+@dataclass
+class DomainStats:
+    """Scores of chunks sent to the model for a domain, split by whether they yielded records."""
+    productive_count: int = 0
+    productive_score_sum: float = 0.0
+    productive_score_min: float = 1.0
+    unproductive_count: int = 0
+    unproductive_score_sum: float = 0.0
+
+
+@dataclass
+class SkipStats:
+    """Per-run counters for chunks the relevance filter kept away from the model."""
+    chunks_total: int = 0
+    calls_skipped: int = 0
+    tokens_skipped: int = 0
+    skipped_scores: List[float] = field(default_factory=list)
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate (~4 characters per token) used for skip accounting."""
+    return max(1, len(text) // 4)
+
+
+def domain_of(url: str) -> str:
+    """Returns the host of a URL without a leading 'www.'."""
+    host = urlparse(url).netloc.lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+def field_terms(field_name: str) -> List[str]:
+    """Returns the lowercase terms matched for a field: its name, name parts and known synonyms."""
+    name = field_name.strip().lower()
+    parts = [part for part in re.split(r"[\s_\-]+", name) if part]
+    terms = {name, *parts}
+    for part in [name, *parts]:
+        terms.update(FIELD_SYNONYMS.get(part, []))
+    return sorted(term for term in terms if term)
+
+
+def has_synonyms(field_name: str) -> bool:
+    """True if the field name, or one of its parts, has an entry in FIELD_SYNONYMS."""
+    name = field_name.strip().lower()
+    return any(part in FIELD_SYNONYMS for part in [name, *re.split(r"[\s_\-]+", name)])
+
+
+def _term_pattern(terms: List[str]) -> "re.Pattern":
+    """Word-bounded alternation for word terms, plain substring match for symbols like '$'."""
+    alternatives = [
+        rf"\b{re.escape(term)}\b" if term[0].isalnum() and term[-1].isalnum() else re.escape(term)
+        for term in terms
+    ]
+    return re.compile("|".join(alternatives))
+
+
+def keyword_score(chunk: str, fields: List[str]) -> float:
+    """Fraction of requested fields with at least one name or synonym hit in the chunk."""
+    if not fields:
+        return 0.0
+    text = chunk.lower()
+    hits = sum(1 for field_name in fields if _term_pattern(field_terms(field_name)).search(text))
+    return hits / len(fields)
+
+
+def density_score(chunk: str) -> float:
+    """Estimates how record-like a chunk is from repeated line structure, prices and dates."""
+    lines = [line.strip() for line in chunk.splitlines() if line.strip()]
+    if len(lines) <= 1:
+        # split_text_into_chunks joins on spaces, so fall back to markdown markers in the flat text.
+        lines = [part for part in re.split(r"\s(?=[*#|!-]\s|\d+\.\s)", chunk) if part.strip()]
+    prefixes: Dict[str, int] = {}
+    for line in lines:
+        prefix = re.sub(r"\w+", "w", line[:3])
+        prefixes[prefix] = prefixes.get(prefix, 0) + 1
+    repeated = max(prefixes.values()) / len(lines) if len(lines) > 2 else 0.0
+
+    per_kchar = 1000 / max(len(chunk), 1)
+    prices = min(len(PRICE_PATTERN.findall(chunk)) * per_kchar / 5, 1.0)
+    dates = min(len(DATE_PATTERN.findall(chunk)) * per_kchar / 3, 1.0)
+    return min(repeated * 0.5 + max(prices, dates) * 0.5 + min(prices, dates) * 0.25, 1.0)
+
+
+class RelevanceFilter:
+    """
+    Scores chunks locally so irrelevant ones (headers, legal text, link blocks) skip the LLM call.
+
+    The score combines field keyword/synonym matches and a record-density estimate.
+    Outcomes of chunks that were sent are fed back per domain; once a domain has enough
+    observations the threshold moves between its productive and unproductive score means,
+    but never above the lowest score that ever yielded records.
+    """
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD, stats_path: Optional[str] = RELEVANCE_STATS_FILE):
+        self.threshold = threshold
+        self.stats_path = stats_path
+        self.domains: Dict[str, DomainStats] = {}
+        self.skip_stats = SkipStats()
+        if stats_path and os.path.exists(stats_path):
+            try:
+                with open(stats_path, "r", encoding="utf-8") as file:
+                    data = json.load(file)
+                if isinstance(data, dict):
+                    self.domains = {domain: DomainStats(**values) for domain, values in data.items()}
+            except (OSError, ValueError, TypeError):
+                self.domains = {}
+
+    def score(self, chunk: str, fields: List[str]) -> float:
+        return KEYWORD_WEIGHT * keyword_score(chunk, fields) + DENSITY_WEIGHT * density_score(chunk)
+
+    def threshold_for(self, domain: str) -> float:
+        stats = self.domains.get(domain)
+        if not stats or stats.productive_count < MIN_DOMAIN_OBSERVATIONS:
+            return self.threshold
+        productive_mean = stats.productive_score_sum / stats.productive_count
+        if stats.unproductive_count >= MIN_DOMAIN_OBSERVATIONS:
+            unproductive_mean = stats.unproductive_score_sum / stats.unproductive_count
+            learned = (productive_mean + unproductive_mean) / 2
+        else:
+            learned = self.threshold
+        return min(learned, stats.productive_score_min)
+
+    def select(self, chunks: List[str], fields: List[str], domain: str = "") -> List[Tuple[int, str, float]]:
+        """
+        Returns (index, chunk, score) for chunks worth sending to the model.
+
+        Chunks are only skipped when the filter can judge them: if a requested field has no
+        known synonyms, or no chunk clears the threshold, every chunk is sent.
+        """
+        threshold = self.threshold_for(domain)
+        scored = [(i, chunk, self.score(chunk, fields)) for i, chunk in enumerate(chunks)]
+        if all(has_synonyms(field_name) for field_name in fields):
+            selected = [item for item in scored if item[2] >= threshold]
+        else:
+            selected = []
+        if not selected:
+            selected = scored
+
+        selected_ids = {item[0] for item in selected}
+        self.skip_stats.chunks_total += len(chunks)
+        for i, chunk, score in scored:
+            if i not in selected_ids:
+                self.skip_stats.calls_skipped += 1
+                self.skip_stats.tokens_skipped += estimate_tokens(chunk)
+                self.skip_stats.skipped_scores.append(round(score, 3))
+        return selected
+
+    def record_outcome(self, domain: str, score: float, records_found: int) -> None:
+        """Feeds back whether a chunk that was sent produced any records."""
+        stats = self.domains.setdefault(domain, DomainStats())
+        if records_found:
+            stats.productive_count += 1
+            stats.productive_score_sum += score
+            stats.productive_score_min = min(stats.productive_score_min, score)
+        else:
+            stats.unproductive_count += 1
+            stats.unproductive_score_sum += score
+
+    def save(self) -> None:
+        """Persists the learned per-domain stats to stats_path."""
+        if not self.stats_path:
+            return
+        directory = os.path.dirname(self.stats_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.stats_path, "w", encoding="utf-8") as file:
+            json.dump({domain: asdict(stats) for domain, stats in self.domains.items()}, file, indent=2)
+
+
+def measure_recall_loss(labelled_chunks: Sequence[Tuple[str, int]], fields: List[str],
+                        relevance_filter: Optional[RelevanceFilter] = None, domain: str = "") -> Dict[str, float]:
+    """
+    Measures what the filter would cost on fixture pages.
+
+    Args:
+        labelled_chunks: (chunk, number of records the chunk really contains) pairs.
+        fields: Fields requested for extraction.
+
+    Returns:
+        dict: Fraction of records lost in skipped chunks and fraction of calls saved.
+    """
+    relevance_filter = relevance_filter or RelevanceFilter(stats_path=None)
+    chunks = [chunk for chunk, _ in labelled_chunks]
+    kept = {index for index, _, _ in relevance_filter.select(chunks, fields, domain)}
+    total_records = sum(count for _, count in labelled_chunks)
+    lost_records = sum(count for i, (_, count) in enumerate(labelled_chunks) if i not in kept)
+    return {
+        "recall_loss": lost_records / total_records if total_records else 0.0,
+        "calls_saved": 1 - len(kept) / len(chunks) if chunks else 0.0,
+    }
@@ -0,0 +1,75 @@
+"""
+Microbenchmark of listing validation with cached versus uncached pydantic models.
+
+All three variants validate the same listings:
+    - uncached: the old hot path, rebuilding the listing and container models with
+      create_model for every chunk, then container_model.model_validate,
+    - cached: the same container_model.model_validate call on the model held by a
+      FieldSetRegistry entry, so the difference is the cost of model creation,
+    - cached TypeAdapter: the entry's List[listing] validator, for comparison.
+
+    python bench_models.py --chunks 2000 --listings 20
+"""
+import time
+import argparse
+from Markdowncnvrtr import create_dynamic_listing_model, create_listings_container_model
+from Registry import FieldSetRegistry
+
+FIELD_SETS = [
+    ["title", "price", "rating"],
+    ["name", "company", "location", "salary"],
+    ["title", "author", "date", "url"],
+]
+
+
+def make_listings(fields, count):
+    return [{field: f"{field} value {i}" for field in fields} for i in range(count)]
+
+
+def bench_uncached(chunks, listings_per_chunk):
+    start = time.perf_counter()
+    for i in range(chunks):
+        fields = FIELD_SETS[i % len(FIELD_SETS)]
+        listing_model = create_dynamic_listing_model(fields)
+        container_model = create_listings_container_model(listing_model)
+        container_model.model_validate({"listings": make_listings(fields, listings_per_chunk)})
+    return time.perf_counter() - start
+
+
+def bench_cached(chunks, listings_per_chunk):
+    registry = FieldSetRegistry()
+    start = time.perf_counter()
+    for i in range(chunks):
+        fields = FIELD_SETS[i % len(FIELD_SETS)]
+        registry.get(fields).container_model.model_validate({"listings": make_listings(fields, listings_per_chunk)})
+    return time.perf_counter() - start
+
+
+def bench_cached_adapter(chunks, listings_per_chunk):
+    registry = FieldSetRegistry()
+    start = time.perf_counter()
+    for i in range(chunks):
+        fields = FIELD_SETS[i % len(FIELD_SETS)]
+        registry.get(fields).validator.validate_python(make_listings(fields, listings_per_chunk))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chunks", type=int, default=2000, help="Validation calls per variant")
+    parser.add_argument("--listings", type=int, default=20, help="Listings validated per call")
+    args = parser.parse_args()
+
+    records = args.chunks * args.listings
+    uncached = bench_uncached(args.chunks, args.listings)
+    cached = bench_cached(args.chunks, args.listings)
+    adapter = bench_cached_adapter(args.chunks, args.listings)
+    print(f"uncached model:       {uncached:.3f} s  ({records / uncached:,.0f} listings/s)")
+    print(f"cached model:         {cached:.3f} s  ({records / cached:,.0f} listings/s)  "
+          f"speedup {uncached / cached:.1f}x")
+    print(f"cached TypeAdapter:   {adapter:.3f} s  ({records / adapter:,.0f} listings/s)  "
+          f"speedup {uncached / adapter:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
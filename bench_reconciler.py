@@ -0,0 +1,165 @@
+"""
+Merge-rule checks and throughput of the record reconciler.
+
+Runs small record sequences through RecordReconciler and compares the number of records
+out and the merge counters with the expected result: exact, partial and near-duplicate
+merges, the identity-conflict rule and case-insensitive field names. Then times a large
+run where every record shares a low-cardinality column.
+
+Exits with status 1 when a case fails or the large run exceeds --max-seconds:
+
+    python bench_reconciler.py --records 6000 --max-seconds 30
+"""
+import sys
+import time
+import argparse
+from Reconciler import RecordReconciler, reconcile_records
+
+DESCRIPTION = (
+    "Lightweight breathable running shoe with responsive foam cushioning, a reinforced heel "
+    "counter and a grippy rubber outsole for road and light trail use in all weather"
+)
+
+CASES = [
+    {
+        "name": "exact duplicate after normalization",
+        "identity_fields": ["title", "price"],
+        "records": [{"title": "Book A", "price": "$10"}, {"title": "book a ", "price": "$10."}],
+        "expected_out": 1,
+        "expected_stats": {"exact_duplicates": 1},
+    },
+    {
+        "name": "exact duplicate with capitalized keys",
+        "identity_fields": ["title", "price"],
+        "records": [{"Title": "Book A", "Price": "10"}, {"title": "Book A", "price": "10"}],
+        "expected_out": 1,
+        "expected_stats": {"exact_duplicates": 1},
+    },
+    {
+        "name": "partial merge, two identity fields",
+        "identity_fields": ["title", "price"],
+        "records": [{"title": "Book A", "price": ""}, {"title": "Book A", "price": "10"}],
+        "expected_out": 1,
+        "expected_stats": {"partial_merges": 1},
+    },
+    {
+        "name": "partial merge, three identity fields",
+        "identity_fields": ["title", "price", "rating"],
+        "records": [
+            {"title": "Tipping the Velvet", "price": "", "rating": "One"},
+            {"title": "Tipping the Velvet", "price": "£53.74", "rating": "One"},
+        ],
+        "expected_out": 1,
+        "expected_stats": {"partial_merges": 1},
+    },
+    {
+        "name": "merged record is re-indexed for exact matches",
+        "identity_fields": ["title", "price"],
+        "records": [
+            {"title": "Book A", "price": ""},
+            {"title": "Book A", "price": "10"},
+            {"title": "Book A", "price": "10"},
+        ],
+        "expected_out": 1,
+        "expected_stats": {"partial_merges": 1, "exact_duplicates": 1},
+    },
+    {
+        "name": "one shared identity value out of three is not a partial",
+        "identity_fields": ["title", "price", "rating"],
+        "records": [{"title": "Widget A", "price": "$10"}, {"title": "", "price": "$10", "rating": "4.5"}],
+        "expected_out": 2,
+        "expected_stats": {"partial_merges": 0, "near_duplicates": 0},
+    },
+    {
+        "name": "near duplicate with a missing identity value",
+        "identity_fields": ["sku", "title"],
+        "records": [
+            {"sku": "", "title": "Pegasus 40", "description": DESCRIPTION},
+            {"sku": "NK-40", "title": "Pegasus 40", "description": DESCRIPTION.replace("all weather", "all weathers")},
+        ],
+        "expected_out": 1,
+        "expected_stats": {"near_duplicates": 1},
+    },
+    {
+        "name": "different identity values never merge",
+        "identity_fields": ["sku"],
+        "records": [
+            {"sku": "100231", "title": "Blue Widget Deluxe", "price": "$10"},
+            {"sku": "100232", "title": "Blue Widget Deluxe", "price": "$10"},
+        ],
+        "expected_out": 2,
+        "expected_stats": {"near_duplicates": 0, "partial_merges": 0},
+    },
+    {
+        "name": "different identity values with capitalized keys",
+        "identity_fields": ["title", "size"],
+        "records": [
+            {"Title": "Pegasus 40", "Size": "UK 8", "Description": DESCRIPTION},
+            {"Title": "Pegasus 40", "Size": "UK 9", "Description": DESCRIPTION},
+        ],
+        "expected_out": 2,
+        "expected_stats": {"near_duplicates": 0, "partial_merges": 0},
+    },
+    {
+        "name": "no identity values on either side never merge fuzzily",
+        "identity_fields": ["sku"],
+        "records": [
+            {"title": "Pegasus 40", "description": DESCRIPTION},
+            {"title": "Pegasus 40", "description": DESCRIPTION + "."},
+        ],
+        "expected_out": 2,
+        "expected_stats": {"near_duplicates": 0, "partial_merges": 0},
+    },
+]
+
+
+def run_case(case: dict) -> list:
+    """Returns a list of failure messages for one case."""
+    reconciler = RecordReconciler(identity_fields=case["identity_fields"])
+    records = list(reconcile_records(case["records"], reconciler))
+    stats = reconciler.stats.as_dict()
+    failures = []
+    if len(records) != case["expected_out"]:
+        failures.append(f"expected {case['expected_out']} records out, got {len(records)}: {records}")
+    for counter, expected in case["expected_stats"].items():
+        if stats[counter] != expected:
+            failures.append(f"expected {counter}={expected}, got {stats[counter]}")
+    return failures
+
+
+def run_scale(count: int) -> float:
+    records = [
+        {"title": f"Product number {i} model {i * 7919 % 100003}", "price": f"${i % 500}.99", "currency": "USD"}
+        for i in range(count)
+    ]
+    reconciler = RecordReconciler(identity_fields=["title", "price", "currency"])
+    start = time.perf_counter()
+    for _ in reconcile_records(records, reconciler):
+        pass
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=6000, help="Records in the throughput run")
+    parser.add_argument("--max-seconds", type=float, default=30.0, help="Threshold for the throughput run")
+    args = parser.parse_args()
+
+    failures = []
+    for case in CASES:
+        case_failures = run_case(case)
+        print(f"{'ok  ' if not case_failures else 'FAIL'} {case['name']}")
+        failures.extend(f"{case['name']}: {failure}" for failure in case_failures)
+
+    elapsed = run_scale(args.records)
+    print(f"{args.records} records with a shared column: {elapsed:.2f} s (threshold {args.max_seconds:.0f} s)")
+    if elapsed > args.max_seconds:
+        failures.append(f"throughput run took {elapsed:.2f} s, over {args.max_seconds:.0f} s")
+
+    for failure in failures:
+        print(f"REGRESSION: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
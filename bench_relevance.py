@@ -0,0 +1,106 @@
+"""
+Recall and savings of the chunk relevance filter on inline fixture pages.
+
+Each fixture is a markdown page (navigation, listing records, legal footer) run through
+split_text_into_chunks exactly like scraper.py does. The records in each chunk are counted
+with the fixture's record pattern, and measure_recall_loss reports the share of records
+lost in skipped chunks and the share of LLM calls saved.
+
+Exits with status 1 when any fixture loses more than --max-recall-loss of its records:
+
+    python bench_relevance.py --chunk-size 8000 --max-recall-loss 0.0
+"""
+import re
+import sys
+import argparse
+from Markdowncnvrtr import split_text_into_chunks
+from Relevance import RelevanceFilter, measure_recall_loss
+
+NAVIGATION = "\n".join(
+    f"[{label}](/{label.lower()})"
+    for label in ["Home", "About", "Contact", "Login", "Register", "Help", "Careers", "Press", "Blog", "Sitemap"] * 60
+)
+LEGAL = "\n\n".join(
+    "Terms of service. By using this website you agree to our use of cookies and to the processing of "
+    "personal data as described in the privacy policy. All rights reserved. Content may not be reproduced "
+    "without permission. Contact our support team for questions about your account or data requests."
+    for _ in range(40)
+)
+RELATED = "\n".join(f"Related: [Guide {i}](/guides/{i}) [Newsletter](/newsletter) [Follow us](/social)" for i in range(120))
+
+FIXTURES = [
+    {
+        "name": "books",
+        "fields": ["title", "price", "rating"],
+        "records": [
+            f"* [Book Title {i}](catalogue/book-{i}.html) £{10 + i % 40}.{i % 100:02d} Rating: Three In stock"
+            for i in range(300)
+        ],
+        "record_pattern": r"\* \[Book Title \d+\]",
+    },
+    {
+        "name": "cars",
+        "fields": ["model", "mileage"],
+        "records": [
+            f"* Honda Civic {2010 + i % 12} - {30000 + i * 117:,} miles - [details](/cars/{i})"
+            for i in range(300)
+        ],
+        "record_pattern": r"\* Honda Civic \d{4}",
+    },
+    {
+        "name": "jobs",
+        "fields": ["company", "salary", "location"],
+        "records": [
+            f"| Engineer {i} | Acme {i} Inc | Remote | ${90000 + i * 250:,} per year | 2024-05-{1 + i % 28:02d} |"
+            for i in range(300)
+        ],
+        "record_pattern": r"\| Engineer \d+ \|",
+    },
+    {
+        "name": "products",
+        "fields": ["name", "sku", "color", "size", "weight"],
+        "records": [
+            f"Trail Runner {i} SKU-{100000 + i} Blue/Grey EU {36 + i % 10} 280 g" for i in range(200)
+        ],
+        "record_pattern": r"Trail Runner \d+ SKU-",
+    },
+    {
+        "name": "articles",
+        "fields": ["headline", "author", "date"],
+        "records": [
+            f"## Story {i}\nBy Writer {i % 17} · Mar {1 + i % 28}, 2024\nA short summary of story {i} for the front page."
+            for i in range(200)
+        ],
+        "record_pattern": r"## Story \d+",
+    },
+]
+
+
+def build_page(fixture: dict) -> str:
+    return "\n\n".join([NAVIGATION, "\n".join(fixture["records"]), RELATED, LEGAL])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chunk-size", type=int, default=8000, help="Chunk size passed to split_text_into_chunks")
+    parser.add_argument("--max-recall-loss", type=float, default=0.0, help="Largest acceptable recall loss per fixture")
+    args = parser.parse_args()
+
+    failures = []
+    for fixture in FIXTURES:
+        chunks = split_text_into_chunks(build_page(fixture), chunk_size=args.chunk_size)
+        pattern = re.compile(fixture["record_pattern"])
+        labelled = [(chunk, len(pattern.findall(chunk))) for chunk in chunks]
+        result = measure_recall_loss(labelled, fixture["fields"], RelevanceFilter(stats_path=None))
+        print(f"{fixture['name']:<9} chunks {len(chunks):>3}  recall loss {result['recall_loss']:.1%}  "
+              f"calls saved {result['calls_saved']:.1%}")
+        if result["recall_loss"] > args.max_recall_loss:
+            failures.append(f"{fixture['name']} lost {result['recall_loss']:.1%} of its records")
+
+    for failure in failures:
+        print(f"REGRESSION: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
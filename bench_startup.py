@@ -0,0 +1,88 @@
+"""
+Startup benchmark for the scraper and UI modules.
+
+Measures, in fresh interpreters:
+    - import time of scraper.py, and that no heavy dependency is loaded by the import,
+    - time-to-first-render of ui.py through Streamlit's AppTest harness.
+
+Exits with status 1 when a measurement exceeds its threshold, so it can gate changes:
+
+    python bench_startup.py --max-import-ms 150 --max-render-ms 3000
+"""
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+HEAVY_MODULES = ["selenium", "webdriver_manager", "pandas", "google.generativeai", "streamlit", "pydantic", "html2text"]
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+IMPORT_PROBE = """
+import sys, time, json
+start = time.perf_counter()
+import scraper
+elapsed = time.perf_counter() - start
+print(json.dumps({"ms": elapsed * 1000, "loaded": [m for m in %r if m in sys.modules]}))
+""" % (HEAVY_MODULES,)
+
+RENDER_PROBE = """
+import time, json
+start = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+app = AppTest.from_file("ui.py", default_timeout=60)
+app.run()
+elapsed = time.perf_counter() - start
+print(json.dumps({"ms": elapsed * 1000, "errors": [str(e.value) for e in app.exception]}))
+"""
+
+
+def run_probe(source: str) -> dict:
+    """Runs a probe in a fresh interpreter from the repo directory and returns its JSON output."""
+    completed = subprocess.run(
+        [sys.executable, "-c", source], cwd=REPO_DIR, capture_output=True, text=True, check=True
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="Fresh-interpreter runs per measurement")
+    parser.add_argument("--max-import-ms", type=float, default=150.0, help="Threshold for median import time")
+    parser.add_argument("--max-render-ms", type=float, default=3000.0, help="Threshold for median first render")
+    args = parser.parse_args()
+
+    failures = []
+
+    import_results = [run_probe(IMPORT_PROBE) for _ in range(args.runs)]
+    import_ms = statistics.median(result["ms"] for result in import_results)
+    loaded = sorted({module for result in import_results for module in result["loaded"]})
+    print(f"import scraper: median {import_ms:.1f} ms over {args.runs} runs (threshold {args.max_import_ms:.0f} ms)")
+    if import_ms > args.max_import_ms:
+        failures.append(f"import time {import_ms:.1f} ms exceeds {args.max_import_ms:.0f} ms")
+    if loaded:
+        failures.append(f"import scraper eagerly loaded: {', '.join(loaded)}")
+
+    try:
+        import streamlit  # noqa: F401
+    except ImportError:
+        print("first render: skipped (streamlit is not installed)")
+    else:
+        render_results = [run_probe(RENDER_PROBE) for _ in range(args.runs)]
+        render_ms = statistics.median(result["ms"] for result in render_results)
+        print(f"first render of ui.py: median {render_ms:.1f} ms over {args.runs} runs "
+              f"(threshold {args.max_render_ms:.0f} ms)")
+        if render_ms > args.max_render_ms:
+            failures.append(f"first render {render_ms:.1f} ms exceeds {args.max_render_ms:.0f} ms")
+        errors = {error for result in render_results for error in result["errors"]}
+        if errors:
+            failures.append(f"ui.py raised during first render: {'; '.join(sorted(errors))}")
+
+    for failure in failures:
+        print(f"REGRESSION: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,32 +1,40 @@
 import os
 import time
 import random
-import requests
 import json
-import pandas as pd
 from datetime import datetime
-from typing import List, Type, Dict, Any, Tuple
-from pydantic import BaseModel, create_model
-import html2text
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
-from dotenv import load_dotenv
-import google.generativeai as genai
-import streamlit as st
-from typing import List, Optional
-from Markdowncnvrtr import *
-# Load environment variables
-load_dotenv()   
-API_KEY = os.getenv('GOOGLE_API_KEY')
-if not API_KEY:
-    raise ValueError("Please set the GOOGLE_API_KEY environment variable")
+from functools import lru_cache
+from typing import List, Dict, Any, Tuple, Optional, TYPE_CHECKING
+from Lazy import LazyModule
+from Markdowncnvrtr import USER_AGENTS, html_to_markdown_with_readability, split_text_into_chunks
+from Reconciler import RecordReconciler
+from Relevance import RelevanceFilter, domain_of
+from Registry import FieldSetRegistry, FieldKey
+
+if TYPE_CHECKING:
+    import pandas
+    from selenium import webdriver
+
+# Heavy dependencies are imported on first use so importing this module stays cheap.
+pd = LazyModule("pandas")
+genai = LazyModule("google.generativeai")
+st = LazyModule("streamlit")
+
+@lru_cache(maxsize=None)
+def get_api_key() -> str:
+    """Loads environment variables and returns the Gemini API key, resolved on first use."""
+    from dotenv import load_dotenv
+    load_dotenv()
+    api_key = os.getenv('GOOGLE_API_KEY')
+    if not api_key:
+        raise ValueError("Please set the GOOGLE_API_KEY environment variable")
+    return api_key
+
+@lru_cache(maxsize=None)
+def configure_genai() -> None:
+    """Configures the Gemini client once, the first time a model is needed."""
+    genai.configure(api_key=get_api_key())
 
-genai.configure(api_key=API_KEY)
 HEADLESS_OPTIONS = ["--headless", "--disable-gpu", "--no-sandbox", "--disable-dev-shm-usage"]
 
 #This system message provides instructions to an AI assistant for extracting information from text
@@ -55,6 +63,8 @@ def check_pagination(driver) -> tuple[bool, Optional[List[str]]]:
         "//button[contains(@class, 'pagination')]"
     ]
     
+    from selenium.webdriver.common.by import By
+
     for selector in common_pagination_selectors:
         try:
             pagination_elements = driver.find_elements(By.XPATH, selector)
@@ -92,7 +102,14 @@ def scroll_page(driver, max_scrolls: int = 5) -> bool:
 
 
 def fetch_html_selenium(url: str) -> dict:
-   
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from webdriver_manager.chrome import ChromeDriverManager
+
     options = Options()
     options.add_argument(f"user-agent={random.choice(USER_AGENTS)}")
     for option in HEADLESS_OPTIONS:
@@ -173,7 +190,7 @@ def fetch_html_selenium(url: str) -> dict:
                 pass
 
 
-def scroll_page(driver: webdriver.Chrome) -> None:
+def scroll_page(driver: "webdriver.Chrome") -> None:
     
     try:
         with st.spinner("Scrolling page to load dynamic content..."):
@@ -201,18 +218,26 @@ def scroll_page(driver: webdriver.Chrome) -> None:
     except Exception as e:
         pass  
 
-def format_data_with_genai(data: str, fields: List[str], model: str) -> Tuple[List[Dict], int, int, float]:
-    """Format data using selected AI model."""
-    field_list = ", ".join(field.strip() for field in fields)
-    prompt = f"""{SYSTEM_MESSAGE}
+def build_prompt_prefix(fields: FieldKey) -> str:
+    """Renders the part of the extraction prompt that depends only on the field set."""
+    field_list = ", ".join(fields)
+    return f"""{SYSTEM_MESSAGE}
 Please extract the following fields: {field_list}
 Return ONLY a complete, valid JSON array where each object contains these fields.
 Extract ALL available entries that match these fields.
 Example format: [{{"field1": "value1"}}, {{"field1": "value2"}}]
 
-{data}"""
+"""
+
+# Per-field-set cache; format_data_with_genai only uses its prompt prefixes (models are built on demand).
+FIELD_SET_REGISTRY = FieldSetRegistry(build_prompt_prefix, maxsize=64)
+
+def format_data_with_genai(data: str, fields: List[str], model: str) -> Tuple[List[Dict], int, int, float]:
+    """Format data using selected AI model."""
+    prompt = FIELD_SET_REGISTRY.get(fields).prompt_prefix + data
     
     if model == "gemini flash-1.5":
+        configure_genai()
         generative_model = genai.GenerativeModel("gemini-1.5-flash")
     else:
         st.error("Selected model is not supported")
@@ -237,16 +262,28 @@ Example format: [{{"field1": "value1"}}, {{"field1": "value2"}}]
     total_cost = (token_counts["input_tokens"] + token_counts["output_tokens"]) * 0.001
     return formatted_data, token_counts["input_tokens"], token_counts["output_tokens"], total_cost
 
-def scraping_function(url: str, fields: List[str], model: str) -> Tuple[pd.DataFrame, int, int, float]:
-    
+def scraping_function(url: str, fields: List[str], model: str,
+                      identity_fields: Optional[List[str]] = None) -> Tuple["pandas.DataFrame", int, int, float]:
+    """
+    Scrapes the URL, extracts the requested fields chunk by chunk and reconciles the results.
+
+    Records repeated across chunk boundaries or overlapping pages are merged by a
+    RecordReconciler keyed on `identity_fields` (defaults to all requested fields).
+    """
+    # Resolve configuration before the chunk loop, which suppresses per-chunk errors.
+    configure_genai()
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     with st.spinner("Loading content from the webpage..."):
         raw_html = fetch_html_selenium(url)
         markdown = markdown = html_to_markdown_with_readability("".join(raw_html['html_content']))
     
     chunks = split_text_into_chunks(markdown, chunk_size=8000)
+    domain = domain_of(url)
+    relevance_filter = RelevanceFilter()
+    selected_chunks = relevance_filter.select(chunks, fields, domain)
     
     all_formatted_data = []
+    reconciler = RecordReconciler(identity_fields=identity_fields or fields)
     total_input_tokens = 0
     total_output_tokens = 0
     total_cost = 0
@@ -254,16 +291,18 @@ def scraping_function(url: str, fields: List[str], model: str) -> Tuple[pd.DataF
     progress_bar = st.progress(0)
     status_text = st.empty()
     
-    for i, chunk in enumerate(chunks):
+    for i, (_, chunk, score) in enumerate(selected_chunks):
         try:
-            status_text.text(f"Working On Segement {i+1} of {len(chunks)}...")
-            progress_bar.progress((i + 1) / len(chunks))
+            status_text.text(f"Working On Segement {i+1} of {len(selected_chunks)}...")
+            progress_bar.progress((i + 1) / len(selected_chunks))
             
             formatted_data, input_tokens, output_tokens, chunk_cost = format_data_with_genai(
                 chunk, fields, model
             )
+            relevance_filter.record_outcome(domain, score, len(formatted_data))
             
-            all_formatted_data.extend(formatted_data)
+            for record in formatted_data:
+                all_formatted_data.extend(reconciler.add(record))
             total_input_tokens += input_tokens
             total_output_tokens += output_tokens
             total_cost += chunk_cost
@@ -271,6 +310,23 @@ def scraping_function(url: str, fields: List[str], model: str) -> Tuple[pd.DataF
         except Exception as e:
             continue  # Suppress error messages for individual chunks
     
+    relevance_filter.save()
+    skip_stats = relevance_filter.skip_stats
+    if skip_stats.calls_skipped:
+        st.info(
+            f"Skipped {skip_stats.calls_skipped} of {skip_stats.chunks_total} segments as irrelevant "
+            f"(~{skip_stats.tokens_skipped} input tokens saved)."
+        )
+
+    all_formatted_data.extend(reconciler.flush())
+    stats = reconciler.stats
+    if stats.records_in:
+        st.info(
+            f"Reconciled {stats.records_in} extracted records into {stats.records_out}: "
+            f"{stats.exact_duplicates} exact duplicates, {stats.near_duplicates} near duplicates, "
+            f"{stats.partial_merges} partial merges, {stats.empty_dropped} empty records dropped."
+        )
+
     if not all_formatted_data:
         st.error("No data was extracted. Please check your fields and try again.")
         return pd.DataFrame(), 0, 0, 0
@@ -4,8 +4,6 @@ from streamlit_tags import st_tags
 from datetime import datetime
 from io import BytesIO
 from scraper import scraping_function
-from Markdowncnvrtr import html_to_markdown_with_readability
-import pandas as pd
 
 CUSTOM_CSS = """
 <style>
@@ -88,6 +86,7 @@ def main():
                         mime="text/csv"
                     )
                     
+                    import pandas as pd
                     output = BytesIO()
                     with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
                         df.to_excel(writer, index=False, sheet_name="ScrapedData")